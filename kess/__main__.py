@@ -3,7 +3,6 @@ from kess.utils.log_setup import init_logging, get_logger, with_context
 from kess.utils.startup import create_parser, validate_arguments, resolve_version
 from kess.utils.shutdown import init_shutdown_manager, is_shutdown_requested
 from kess.health import HealthServer, MetricsServer
-import time
 
 def main() -> int:
     parser = create_parser()
@@ -45,8 +44,8 @@ def main() -> int:
         log_ctx.info("Starting http server for health checks")
         health.start()
         health.set_ready(True)
-        health.register_readiness_check("k8s_client", lambda: (True, None))
-        health.register_readiness_check("config_loaded", lambda: (cfg is not None, None))
+        health.register_readiness_check("k8s_client", lambda: (True, None), fast=True)
+        health.register_readiness_check("config_loaded", lambda: (cfg is not None, None), fast=True)
         log_ctx.info("kess http server started")
 
         # start metrics server
@@ -59,13 +58,10 @@ def main() -> int:
         # TODO: change this with actual application logic later.
         # Main loop with shutdown checking (keeping the 60-second sleep as requested)
         log_ctx.info("Entering main loop (sleeping for 60 seconds)")
-        start_time = time.time()
 
-        while time.time() - start_time < 60:
-            if is_shutdown_requested():
-                log_ctx.info("Shutdown requested, breaking out of main loop")
-                break
-            time.sleep(1)  # Check shutdown every second instead of blocking for 60s
+        # Sleep until the deadline or until a signal sets the shutdown event
+        if shutdown_manager.wait_for_shutdown(timeout=60):
+            log_ctx.info("Shutdown requested, breaking out of main loop")
 
         if not is_shutdown_requested():
             log_ctx.info("No runner wired yet; exiting cleanly.")
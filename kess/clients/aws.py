@@ -1,11 +1,28 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple, Type
 
-import boto3
 import base64
+import functools
 import time
-from botocore.exceptions import ClientError, NoCredentialsError
 from kess.utils.log_setup import get_logger, with_context
 
+_CTX = with_context(get_logger("aws_client"), component="aws_client")
+
+
+@functools.lru_cache(maxsize=None)
+def _botocore_exc() -> Tuple[Type[Exception], Type[Exception]]:
+    """Import botocore exceptions on first use: (ClientError, NoCredentialsError)."""
+    from botocore.exceptions import ClientError, NoCredentialsError
+    return ClientError, NoCredentialsError
+
+
+@functools.lru_cache(maxsize=64)
+def _region_from_url(ecr_url: str) -> Optional[str]:
+    """Extract the region from <account>.dkr.ecr.<region>.amazonaws.com[/...], or None."""
+    parts = ecr_url.split('.')
+    if len(parts) < 4:
+        return None
+    return parts[3]
+
 
 class AWSClient:
     """AWS Client for interacting with AWS services."""
@@ -14,9 +31,14 @@ class AWSClient:
         Initialize the AWS client with optional credentials.
         :param credentials: Optional dict with AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY
         """
-        self._ctx = with_context(get_logger("aws_client"), component="aws_client")
+        self._ctx = _CTX
         self._credentials = credentials
 
+        # boto3 is heavy to import; only pay for it once ECR work is requested
+        import boto3
+        self._boto3 = boto3
+        self._region_clients: Dict[str, Any] = {}
+
         if credentials:
             self._ctx.debug("Using provided AWS credentials.")
             self.session = boto3.Session(
@@ -29,6 +51,7 @@ class AWSClient:
 
     def validate_ecr_credentials(self) -> bool:
         """Validate that AWS credentials can access ECR."""
+        client_error, no_credentials_error = _botocore_exc()
         try:
             ecr_client = self.session.client('ecr')
 
@@ -37,10 +60,10 @@ class AWSClient:
             self._ctx.info("AWS ECR credentials validated successfully")
             return True
 
-        except ClientError as e:
+        except client_error as e:
             self._ctx.error(f"AWS ECR validation failed: {e}")
             return False
-        except NoCredentialsError:
+        except no_credentials_error:
             self._ctx.error("No AWS credentials found")
             return False
         except Exception as e:
@@ -49,15 +72,20 @@ class AWSClient:
 
     def _parse_ecr_response(self, auth_data: Dict[str, Any], server: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse ECR authorization response."""
+        now = int(time.time())
         try:
             auth_token = auth_data.get('authorizationToken')
             if not auth_token:
                 self._ctx.error("No authorization token in response")
                 return None
 
-            # Decode base64 token to get username:password
-            decoded_token = base64.b64decode(auth_token).decode('utf-8')
-            username, password = decoded_token.split(':', 1)
+            # Decode base64 token to get username:password (ECR tokens are ASCII)
+            user, sep, secret = base64.b64decode(auth_token).partition(b':')
+            if not sep:
+                self._ctx.error("Malformed authorization token in response")
+                return None
+            username = user.decode('ascii')
+            password = secret.decode('ascii')
 
             if server:
                 endpoint = server
@@ -71,7 +99,7 @@ class AWSClient:
                 'username': username,
                 'password': password,
                 'server': endpoint,
-                'timestamp': int(time.time())
+                'timestamp': now
             }
 
             self._ctx.info(f"Successfully parsed ECR token for {endpoint}")
@@ -99,18 +127,30 @@ class AWSClient:
             self._ctx.error(f"Failed to get default ECR token: {e}")
             return None
 
+    def _get_region_client(self, region: str) -> Any:
+        """Get (or create once) the ECR client for a region."""
+        client = self._region_clients.get(region)
+        if client is None:
+            from botocore.config import Config as BotoConfig
+            client = self.session.client(
+                'ecr',
+                region_name=region,
+                config=BotoConfig(max_pool_connections=10, retries={'max_attempts': 5, 'mode': 'adaptive'}),
+            )
+            client = self._region_clients.setdefault(region, client)
+        return client
+
     def _get_specific_ecr_token(self, ecr_url: str) -> Optional[Dict[str, Any]]:
         try:
-            parts = ecr_url.split('.')
-            if len(parts) < 4:
+            region = _region_from_url(ecr_url)
+            if region is None:
                 self._ctx.error(f"Invalid ECR URL format: {ecr_url}")
                 return None
 
-            region = parts[3]
             self._ctx.info(f"Using ECR region: {region}")
 
-            # Create ECR client for specific region
-            ecr_client = self.session.client('ecr', region_name=region)
+            # Reuse the ECR client for this region
+            ecr_client = self._get_region_client(region)
             response = ecr_client.get_authorization_token()
             if not response.get('authorizationData'):
                 self._ctx.error("No authorization data in ECR response")
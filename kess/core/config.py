@@ -1,9 +1,8 @@
 import argparse
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from typing import Optional, Any, Dict
 from kess.utils.log_setup import get_logger, with_context
 import os
-import yaml
 
 @dataclass(frozen=True)
 class Config:
@@ -21,16 +20,40 @@ class Config:
     metrics_port: int = 9090
 
 
+# annotation lookups used by the override scans, computed once
+_ANN = Config.__annotations__
+_ANN_FROZEN = frozenset(_ANN)
+
 # global
 _CONFIG: Optional[Config] = None
+_LOADER: Any = None
 _log = get_logger(__name__)
 log_ctx = with_context(_log, source="config")
 
+def _yaml_loader() -> Any:
+    """Resolve the YAML loader once, preferring the libyaml-backed CSafeLoader."""
+    global _LOADER
+    if _LOADER is None:
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _LOADER = loader
+    return _LOADER
+
 def _load_file(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        log_ctx.debug("Config file %s not found, using defaults", path)
+        return {}
+    if not os.path.isfile(path):
+        # e.g. a ConfigMap mounted as a directory; open() below fails loudly, as it always has
+        log_ctx.warning("Config path %s exists but is not a regular file", path)
+
+    import yaml
     try:
         with open(path, "r", encoding="utf-8") as f:
             try:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_yaml_loader())
                 if not isinstance(data, dict):
                     return {}
 
@@ -40,6 +63,7 @@ def _load_file(path: str) -> Dict[str, Any]:
                 log_ctx.debug("Defaulting to empty config")
                 return {}
     except FileNotFoundError:
+        # removed between the isfile() check and open()
         log_ctx.debug("Config file %s not found, using defaults", path)
         return {}
 
@@ -55,41 +79,43 @@ def _coerce(value: str, to_type: Any):
 def _load_env_overrides(model: type[Config]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     prefix = "KESS_"
-    ann = model.__annotations__
-    for k, v in os.environ.items():
-        if not k.startswith(prefix):
-            continue
-        key = k[len(prefix):].lower()
-        if key in ann:
-            try:
-                out[key] = _coerce(v, ann[key])
-            except Exception:
-                pass
+    plen = len(prefix)
+    ann = _ANN if model is Config else model.__annotations__
+    keys = _ANN_FROZEN if model is Config else frozenset(ann)
+    hits = [
+        (key, v) for k, v in os.environ.items()
+        if k.startswith(prefix) and (key := k[plen:].lower()) in keys
+    ]
+    for key, v in hits:
+        try:
+            out[key] = _coerce(v, ann[key])
+        except Exception:
+            pass
 
     return out
 
 def _cli_overrides(args: argparse.Namespace) -> Dict[str, Any]:
-    return {k: v for k, v in vars(args).items() if v is not None and k in Config.__annotations__}
+    values = vars(args)
+    return {k: v for k, v in values.items() if v is not None and k in _ANN_FROZEN}
 
 def init_config(args: argparse.Namespace | None = None) -> Config:
     """
     Merge: defaults <- file <- env <- CLI (CLI wins). Call once at startup.
     """
-    cfg = Config()
+    merged: Dict[str, Any] = {}
 
     # load from file
-    file_path = (getattr(args, "config_file", None) if args else None or os.getenv("KESS_CONFIG")) or cfg.config_file
-    file_vals = _load_file(file_path)
-    cfg = replace(cfg, **{k: v for k, v in file_vals.items() if k in Config.__annotations__})
+    file_path = (getattr(args, "config_file", None) if args else None or os.getenv("KESS_CONFIG")) or Config.config_file
+    merged.update({k: v for k, v in _load_file(file_path).items() if k in _ANN_FROZEN})
 
     # load from env
-    env_vals = _load_env_overrides(Config)
-    cfg = replace(cfg, **env_vals)
+    merged.update(_load_env_overrides(Config))
 
     # load from CLI
     if args:
-        cli_vals = _cli_overrides(args)
-        cfg = replace(cfg, **cli_vals)
+        merged.update(_cli_overrides(args))
+
+    cfg = Config(**merged)
 
     global _CONFIG
     _CONFIG = cfg
@@ -4,8 +4,10 @@
 - exposes metrics as attributes
 """
 import threading
+from functools import cached_property
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 from contextlib import nullcontext
+from typing import Any, Callable, Dict
 from kess.utils.log_setup import get_logger
 
 
@@ -34,17 +36,9 @@ class MetricsServer:
         self._log = get_logger(__name__)
         self._started = False
         self._lock = threading.Lock()
-
-        self.secrets_synced = None
-        self.sync_failures = None
-        self.token_expiry = None
-        self.last_sync = None
-        self.next_sync_eta = None
-        self.readiness = None
-        self.liveness = None
-        self.shutdown_status = None
-        self.sync_duration = None
-
+        # Each metric must be registered only once, but cached_property takes no lock on 3.12+
+        self._metrics: Dict[str, Any] = {}
+        self._metrics_lock = threading.Lock()
 
     def start(self) -> None:
         with self._lock:
@@ -53,42 +47,12 @@ class MetricsServer:
 
             # Start the HTTP server (daemon thread managed by the library)
             start_http_server(self.port, addr=self.host)
-
-            # Define metrics
-            self.secrets_synced = Counter(
-                "kess_secrets_synced_total",
-                "Number of ImagePullSecrets created or patched"
-            )
-
-            self.sync_failures = Counter(
-                "kess_sync_failures_total",
-                "Number of sync failures"
-            )
-
-            self.token_expiry = Gauge(
-                "kess_token_expiry_timestamp",
-                "ECR token expiry as a Unix timestamp",
-                ["registry"]
-            )
-
-            self.last_sync = Gauge(
-                "kess_last_sync_timestamp",
-                "Last successful sync time (unix timestamp)"
-            )
-
-            self.next_sync_eta = Gauge(
-                "kess_next_sync_eta_seconds",
-                "Seconds until next planned sync (>=0; 0/omit if unknown)"
-            )
-
-            self.readiness = Gauge("kess_readiness", "Readiness (1=ready, 0=not ready)")
-            self.liveness = Gauge("kess_liveness", "Liveness (1=live, 0=not live)")
-            self.shutdown_status = Gauge("kess_shutdown_status", "Shutdown status (1=shutting down, 0=running)")
-
-            self.sync_duration = Histogram(
-                "kess_sync_duration_seconds",
-                "Duration of a full sync round",
-                buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60),
+            # Export every series from the first scrape (counters at 0, shutdown_status=0
+            # while running), not only once the code path that sets it has run
+            _ = (
+                self.secrets_synced, self.sync_failures, self.token_expiry, self.last_sync,
+                self.next_sync_eta, self.readiness, self.liveness, self.shutdown_status,
+                self.sync_duration,
             )
 
             self._started = True
@@ -99,6 +63,79 @@ class MetricsServer:
 
     def sync_timer(self):
         """Context manager to time a sync cycle even if metrics aren't started."""
-        if self._started and self.sync_duration is not None:
+        if self._started:
             return self.sync_duration.time()
         return nullcontext()
+
+    def _metric(self, name: str, build: Callable[[], Any]) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._metrics_lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = build()
+        return metric
+
+    # -------------------- Metrics (built by start() or on first access) --------------------
+
+    @cached_property
+    def secrets_synced(self) -> Counter:
+        return self._metric("secrets_synced", lambda: Counter(
+            "kess_secrets_synced_total",
+            "Number of ImagePullSecrets created or patched"
+        ))
+
+    @cached_property
+    def sync_failures(self) -> Counter:
+        return self._metric("sync_failures", lambda: Counter(
+            "kess_sync_failures_total",
+            "Number of sync failures"
+        ))
+
+    @cached_property
+    def token_expiry(self) -> Gauge:
+        return self._metric("token_expiry", lambda: Gauge(
+            "kess_token_expiry_timestamp",
+            "ECR token expiry as a Unix timestamp",
+            ["registry"]
+        ))
+
+    @cached_property
+    def last_sync(self) -> Gauge:
+        return self._metric("last_sync", lambda: Gauge(
+            "kess_last_sync_timestamp",
+            "Last successful sync time (unix timestamp)"
+        ))
+
+    @cached_property
+    def next_sync_eta(self) -> Gauge:
+        return self._metric("next_sync_eta", lambda: Gauge(
+            "kess_next_sync_eta_seconds",
+            "Seconds until next planned sync (>=0; 0/omit if unknown)"
+        ))
+
+    @cached_property
+    def readiness(self) -> Gauge:
+        return self._metric("readiness", lambda: Gauge(
+            "kess_readiness", "Readiness (1=ready, 0=not ready)"
+        ))
+
+    @cached_property
+    def liveness(self) -> Gauge:
+        return self._metric("liveness", lambda: Gauge(
+            "kess_liveness", "Liveness (1=live, 0=not live)"
+        ))
+
+    @cached_property
+    def shutdown_status(self) -> Gauge:
+        return self._metric("shutdown_status", lambda: Gauge(
+            "kess_shutdown_status", "Shutdown status (1=shutting down, 0=running)"
+        ))
+
+    @cached_property
+    def sync_duration(self) -> Histogram:
+        return self._metric("sync_duration", lambda: Histogram(
+            "kess_sync_duration_seconds",
+            "Duration of a full sync round",
+            buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60),
+        ))
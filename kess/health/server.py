@@ -5,19 +5,26 @@ Endpoints:
   GET /healthz  -> 200 if liveness OK, else 503
   GET /readyz   -> 200 if ready AND all readiness checks pass (within timeout), else 503
   GET /status   -> 200 JSON with ready/live flags, timestamps, next_sync_in, and check details
+                   (checks are reported as not evaluated until ready; ?full=1 forces evaluation)
 
 Notes:
-  - Uses stdlib http.server on a daemon thread (no extra deps).
+  - Uses stdlib http.server on a daemon thread (no extra deps); each request gets its own
+    thread so a slow /status never stalls /healthz.
+  - Responses are HTTP/1.1 with Content-Length and Nagle disabled, so probes can keep the
+    connection alive and short bodies flush immediately; idle connections are closed after 5s.
   - Readiness is an explicit flag you toggle; liveness can be forced to 503 via set_liveness_ok(False).
   - Readiness checks are fast, non-blocking callables; each is executed with a short timeout.
+  - Check results and the /status payload are cached for status_cache_seconds (default 0.5s)
+    so frequent probes and scrapes don't re-run every check; any state setter invalidates them.
   - Intended to be started very early with ready=False, then set to True once the app is ready.
 """
 import json
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 from kess.utils.log_setup import get_logger
 
@@ -25,6 +32,24 @@ ReadinessCheck = Callable[[], Tuple[bool, Optional[str]]]
 _JSON_CT = "application/json; charset=utf-8"
 _TEXT_CT = "text/plain; charset=utf-8"
 
+# Idle keep-alive connections are closed after this long, releasing their thread
+_IDLE_TIMEOUT_SECONDS = 5.0
+_CACHE_EMPTY = float("-inf")
+
+# Fixed probe bodies, encoded once
+_B_OK = b"ok\n"
+_B_NOT_OK = b"not ok\n"
+_B_READY = b"ready\n"
+_B_NOT_READY = b"not ready\n"
+_B_SHUTTING = b"shutting down\n"
+_B_NOT_FOUND = b"not found\n"
+
+
+class _HealthHTTPServer(ThreadingHTTPServer):
+    # Handler threads must not keep the process alive; rebind quickly on restart.
+    daemon_threads = True
+    allow_reuse_address = True
+
 
 class HealthServer:
     """
@@ -47,31 +72,44 @@ class HealthServer:
         *,
         prog: str = "kess",
         checks_timeout_seconds: float = 0.25,
-        max_check_workers: int = 4
+        max_check_workers: int = 4,
+        status_cache_seconds: float = 0.5
     ) -> None:
         self.host = host
         self.port = port
         self.prog = prog
         self.checks_timeout_seconds = checks_timeout_seconds
         self.max_check_workers = max(1, max_check_workers)
+        self.status_cache_seconds = max(0.0, status_cache_seconds)
 
         self._log = get_logger(__name__)
 
-        # Flags & state
+        # Flags & state (read lock-free on every probe: Events for flags,
+        # plain int/None references for timestamps, which assign atomically)
         self._ready = threading.Event()
-        self._live_ok = True
-        self._shutting_down = False
+        self._live_ok_ev = threading.Event()
+        self._live_ok_ev.set()
+        self._shutting_down_ev = threading.Event()
         self._started_at = int(time.time())
         self._last_sync_ts: Optional[int] = None
         self._next_sync_in: Optional[int] = None
-        self._state_lock = threading.Lock()
 
         # Readiness checks registry
         self._checks_lock = threading.Lock()
-        self._checks: Dict[str, ReadinessCheck] = {}
+        self._checks: Dict[str, Tuple[ReadinessCheck, bool]] = {}
+        self._check_pool: Optional[ThreadPoolExecutor] = None
+        self._pool_closed = False
+
+        # Short-TTL caches for check results and /status payload: (monotonic ts, value).
+        # Empty entries are stamped -inf: monotonic() may itself be < TTL just after boot.
+        self._cache_lock = threading.Lock()
+        self._checks_cache: Tuple[float, Tuple[bool, Dict[str, Dict[str, Any]]]] = (_CACHE_EMPTY, (True, {}))
+        self._status_cache: Tuple[float, Dict[str, Any]] = (_CACHE_EMPTY, {})
+        # Bumped on every invalidation; a build that raced one is not stored
+        self._cache_gen = 0
 
         # HTTP server infra
-        self._httpd: Optional[HTTPServer] = None
+        self._httpd: Optional[ThreadingHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
 
     # -------------------- Public API --------------------
@@ -85,24 +123,33 @@ class HealthServer:
         server = self
 
         class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Set TCP_NODELAY per connection to avoid delayed-ACK stalls on tiny bodies.
+            disable_nagle_algorithm = True
+            # Keep-alive must not pin a thread forever on an idle probe connection;
+            # an idle socket is dropped after this many seconds.
+            timeout = _IDLE_TIMEOUT_SECONDS
+
             # Silence default access logs; rely on structured logging.
             def log_message(self, _format: str, *_args: Any) -> None:  # noqa: N802
                 return
 
             def _write(
-                self, code: int, body: str, content_type: str = _TEXT_CT, headers: Optional[Dict[str, str]] = None
+                self, code: int, body: bytes, content_type: str = _TEXT_CT, headers: Optional[Dict[str, str]] = None
             ) -> None:
                 self.send_response(code)
                 self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
                 self.send_header("Cache-Control", "no-store, must-revalidate")
                 if headers:
                     for k, v in headers.items():
                         self.send_header(k, v)
                 self.end_headers()
-                self.wfile.write(body.encode("utf-8"))
+                self.wfile.write(body)
 
             def do_GET(self) -> None:  # noqa: N802
-                path = self.path
+                url = urlsplit(self.path)
+                path = url.path
                 if path == "/healthz" or path == "/livez":
                     code, body = server._handle_healthz()
                     self._write(code, body)
@@ -112,13 +159,18 @@ class HealthServer:
                     self._write(code, body)
                     return
                 if path == "/status":
-                    payload = server._status_payload()
-                    self._write(200, json.dumps(payload, separators=(",", ":")), content_type=_JSON_CT)
+                    full = parse_qs(url.query).get("full", [""])[-1].lower() in ("1", "true", "yes")
+                    payload = server._status_payload(full=full)
+                    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                    self._write(200, body, content_type=_JSON_CT)
                     return
-                self._write(404, "not found\n")
+                self._write(404, _B_NOT_FOUND)
 
-        httpd = HTTPServer((self.host, self.port), _Handler)
+        httpd = _HealthHTTPServer((self.host, self.port), _Handler)
         self._httpd = httpd
+        with self._checks_lock:
+            self._pool_closed = False
+        self._ensure_check_pool()
 
         self._thread = threading.Thread(target=httpd.serve_forever, name="kess-health", daemon=True)
         self._thread.start()
@@ -139,6 +191,12 @@ class HealthServer:
             thread.join(timeout=timeout)
             self._httpd = None
             self._thread = None
+            with self._checks_lock:
+                pool, self._check_pool = self._check_pool, None
+                # Requests still draining on keep-alive threads must not recreate it
+                self._pool_closed = True
+            if pool is not None:
+                pool.shutdown(wait=False)
             self._log.info("Health server stopped")
 
     def set_ready(self, ready: bool) -> None:
@@ -149,52 +207,89 @@ class HealthServer:
         else:
             self._ready.clear()
             self._log.info("Readiness set to false")
+        self._invalidate_caches()
 
     def set_shutting_down(self, shutting_down: bool) -> None:
         """Set shutdown flag to indicate application is shutting down."""
-        with self._state_lock:
-            self._shutting_down = shutting_down
         if shutting_down:
+            self._shutting_down_ev.set()
             self._log.info("Health server marked as shutting down")
         else:
+            self._shutting_down_ev.clear()
             self._log.info("Health server shutdown flag cleared")
+        self._invalidate_caches()
 
     def set_liveness_ok(self, ok: bool, *, reason: Optional[str] = None) -> None:
         """
         If set to False, /healthz will return 503. Keep it True during graceful shutdown
         so the process can exit cleanly without being restarted.
         """
-        with self._state_lock:
-            self._live_ok = ok
         if ok:
+            self._live_ok_ev.set()
             self._log.warning("Liveness restored to OK")
         else:
+            self._live_ok_ev.clear()
             self._log.error("Liveness set to NOT OK%s", f" (reason: {reason})" if reason else "")
+        self._invalidate_caches()
 
     def set_last_sync(self, when_unix: Optional[int] = None) -> None:
         """Record the time of the last successful full sync (defaults to now)."""
-        with self._state_lock:
-            self._last_sync_ts = int(when_unix or time.time())
+        self._last_sync_ts = int(when_unix or time.time())
+        self._invalidate_caches()
 
     def set_next_sync_in(self, seconds: Optional[int]) -> None:
         """Record ETA (in seconds) until the next planned sync; set None if unknown."""
-        with self._state_lock:
-            self._next_sync_in = None if seconds is None else max(0, int(seconds))
+        self._next_sync_in = None if seconds is None else max(0, int(seconds))
+        self._invalidate_caches()
 
-    def register_readiness_check(self, name: str, fn: ReadinessCheck) -> None:
+    def register_readiness_check(self, name: str, fn: ReadinessCheck, *, fast: bool = False) -> None:
         """
         Register a fast, non-blocking readiness check.
         fn must return (ok: bool, reason: Optional[str]).
+        fast=True runs the check inline in the request thread (no pool, no timeout);
+        only use it for pure, in-memory checks that cannot block.
         """
         if not callable(fn):
             raise TypeError("readiness check must be callable")
         with self._checks_lock:
-            self._checks[name] = fn
+            self._checks[name] = (fn, fast)
+        self._invalidate_caches()
         self._log.info("Registered readiness check: %s", name)
 
     # -------------------- Internal helpers --------------------
 
+    def _ensure_check_pool(self) -> Optional[ThreadPoolExecutor]:
+        """Return the shared readiness-check pool, creating it on first use (None once stopped)."""
+        with self._checks_lock:
+            if self._check_pool is None and not self._pool_closed:
+                self._check_pool = ThreadPoolExecutor(
+                    max_workers=self.max_check_workers, thread_name_prefix="kess-ready"
+                )
+            return self._check_pool
+
+    def _invalidate_caches(self) -> None:
+        with self._cache_lock:
+            self._cache_gen += 1
+            self._checks_cache = (_CACHE_EMPTY, (True, {}))
+            self._status_cache = (_CACHE_EMPTY, {})
+
     def _eval_checks(self) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        """
+        Readiness check results, reused for status_cache_seconds after each evaluation.
+        Returns (all_ok, details_by_check).
+        """
+        ts, result = self._checks_cache
+        if time.monotonic() - ts < self.status_cache_seconds:
+            return result
+
+        gen = self._cache_gen
+        result = self._run_checks()
+        with self._cache_lock:
+            if gen == self._cache_gen:
+                self._checks_cache = (time.monotonic(), result)
+        return result
+
+    def _run_checks(self) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
         """
         Execute registered readiness checks with a small timeout.
         Returns (all_ok, details_by_check).
@@ -206,16 +301,39 @@ class HealthServer:
             return True, {}
 
         all_ok = True
-        details: Dict[str, Dict[str, Any]] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        fast_items = [(name, fn) for name, (fn, fast) in items if fast]
+        slow_items = [(name, fn) for name, (fn, fast) in items if not fast]
 
-        # Small thread pool to avoid blocking the request
-        workers = min(len(items), self.max_check_workers)
         start_batch = time.perf_counter()
-        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kess-ready") as pool:
-            futures = {
-                name: pool.submit(self._safe_check_wrapper, name, fn)
-                for name, fn in items
-            }
+
+        # Trivial checks run inline; a thread hop would cost more than the check
+        for name, fn in fast_items:
+            t0 = time.perf_counter()
+            try:
+                ok, reason = self._safe_check_wrapper(name, fn)
+            except Exception as e:
+                ok, reason = False, f"error: {e}"
+            dur_ms = int((time.perf_counter() - t0) * 1000)
+
+            results[name] = {"ok": ok, "reason": reason, "duration_ms": dur_ms}
+            all_ok = all_ok and ok
+
+        if slow_items:
+            # Shared pool (created once per server) to avoid blocking the request
+            pool = self._ensure_check_pool()
+            try:
+                futures = {
+                    name: pool.submit(self._safe_check_wrapper, name, fn)
+                    for name, fn in slow_items
+                } if pool is not None else {}
+            except RuntimeError:
+                # pool shut down by stop() between lookup and submit
+                futures = {}
+            for name, _ in slow_items:
+                if name not in futures:
+                    results[name] = {"ok": False, "reason": "server stopped", "duration_ms": 0}
+                    all_ok = False
             for name, fut in futures.items():
                 t0 = time.perf_counter()
                 try:
@@ -226,9 +344,12 @@ class HealthServer:
                 except Exception as e:
                     ok, reason, dur_ms = False, f"error: {e}", int((time.perf_counter() - t0) * 1000)
 
-                details[name] = {"ok": ok, "reason": reason, "duration_ms": dur_ms}
+                results[name] = {"ok": ok, "reason": reason, "duration_ms": dur_ms}
                 all_ok = all_ok and ok
 
+        # Report in registration order
+        details: Dict[str, Dict[str, Any]] = {name: results[name] for name, _ in items}
+
         _ = start_batch  # reserved for future aggregate metrics
         return all_ok, details
 
@@ -241,51 +362,74 @@ class HealthServer:
         # Allow boolean-only returns
         return bool(res), None
 
-    def _handle_healthz(self) -> Tuple[int, str]:
-        with self._state_lock:
-            live_ok = self._live_ok
-            shutting_down = self._shutting_down
-        
-        if shutting_down:
-            return 200, "shutting down\n"  # Still alive during shutdown
-        elif live_ok:
-            return 200, "ok\n"
+    def _handle_healthz(self) -> Tuple[int, bytes]:
+        if self._shutting_down_ev.is_set():
+            return 200, _B_SHUTTING  # Still alive during shutdown
+        elif self._live_ok_ev.is_set():
+            return 200, _B_OK
         else:
-            return 503, "not ok\n"
+            return 503, _B_NOT_OK
 
-    def _handle_readyz(self) -> Tuple[int, str]:
-        with self._state_lock:
-            shutting_down = self._shutting_down
-        
-        if shutting_down:
-            return 503, "shutting down\n"  # Not ready for new work during shutdown
+    def _handle_readyz(self) -> Tuple[int, bytes]:
+        if self._shutting_down_ev.is_set():
+            return 503, _B_SHUTTING  # Not ready for new work during shutdown
         
         if not self._ready.is_set():
-            return 503, "not ready\n"
+            return 503, _B_NOT_READY
 
         all_ok, details = self._eval_checks()
         if all_ok:
-            return 200, "ready\n"
+            return 200, _B_READY
 
-        # Aggregate reasons (short)
-        problems: List[str] = []
+        # Aggregate reasons (short); only failing checks pay for encoding
+        problems: List[bytes] = []
         for name, d in details.items():
             if not d.get("ok", False):
                 reason = d.get("reason") or "failed"
-                problems.append(f"{name}: {reason}")
-        body = "not ready: " + "; ".join(problems) + "\n"
+                problems.append(f"{name}: {reason}".encode("utf-8"))
+        body = b"not ready: " + b"; ".join(problems) + b"\n"
         return 503, body
 
-    def _status_payload(self) -> Dict[str, Any]:
-        with self._state_lock:
-            last_sync = self._last_sync_ts
-            next_sync = self._next_sync_in
-            live_ok = self._live_ok
-            shutting_down = self._shutting_down
-            started = self._started_at
+    def _status_payload(self, *, full: bool = False) -> Dict[str, Any]:
+        """
+        /status body, reused for status_cache_seconds after each build.
+        full=True always evaluates checks and bypasses the payload cache.
+        """
+        if full:
+            return self._build_status_payload(full=True)
+
+        ts, payload = self._status_cache
+        if time.monotonic() - ts < self.status_cache_seconds:
+            return payload
+
+        gen = self._cache_gen
+        payload = self._build_status_payload()
+        with self._cache_lock:
+            if gen == self._cache_gen:
+                self._status_cache = (time.monotonic(), payload)
+        return payload
+
+    def _build_status_payload(self, *, full: bool = False) -> Dict[str, Any]:
+        last_sync = self._last_sync_ts
+        next_sync = self._next_sync_in
+        live_ok = self._live_ok_ev.is_set()
+        shutting_down = self._shutting_down_ev.is_set()
+        started = self._started_at
 
         ready_flag = self._ready.is_set()
-        _, details = self._eval_checks()
+        if full:
+            # Explicit request for fresh results: bypass the checks cache too
+            _, details = self._run_checks()
+        elif ready_flag or shutting_down:
+            _, details = self._eval_checks()
+        else:
+            # Still starting up: check details are noise, don't run them
+            with self._checks_lock:
+                names = list(self._checks)
+            details = {
+                name: {"ok": False, "reason": "not evaluated (server not ready)", "duration_ms": 0}
+                for name in names
+            }
         payload: Dict[str, Any] = {
             "prog": self.prog,
             "ready": bool(ready_flag) and not shutting_down,
@@ -1,13 +1,53 @@
+import functools
 import json
 import logging
 import os
 import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict
+import warnings
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Built once: json.dumps() with non-default options constructs a new encoder per call
+_dumps_stdlib: Callable[[Any], str] = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=str
+).encode
+_STDLIB_ENCODERS = (_dumps_stdlib, json.encoder.encode_basestring)
+
+
+@functools.cache
+def _json_encoders() -> Tuple[Callable[[Any], str], Callable[[str], str]]:
+    """
+    (dumps, dumps_str) for JSON records: orjson when installed, else stdlib. Resolved on
+    first JsonFormatter so text-format runs never import orjson.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return _STDLIB_ENCODERS
+
+    # str() for unknown values, as the stdlib encoder's default; big ints fall back to stdlib
+    opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, default=str, option=opts).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return _dumps_stdlib(obj)
+
+    return dumps, dumps
 
 
 _CONFIGURED = False
+_INIT_LOCK = threading.Lock()
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 _TIMEFMT = "%Y-%m-%dT%H:%M:%SZ"
 _TEXT_FMT = "%(asctime)s %(levelname)-7s %(prog)-4s %(module)-15.15s:%(lineno)4d: %(message)s"
 _STD_FIELDS = {
@@ -15,48 +55,157 @@ _STD_FIELDS = {
     "exc_info", "exc_text", "stack_info", "lineno", "funcName", "created", "msecs",
     "relativeCreated", "thread", "threadName", "processName", "process",
 }
+# record attributes never emitted as extras ("taskName" is a LogRecord field since 3.12)
+_SKIP = frozenset(_STD_FIELDS | {"prog", "source", "message", "asctime", "taskName"})
+
+# (unix second, "YYYY-mm-ddTHH:MM:SS") of the last second rendered; a single tuple so
+# concurrent handlers swap it atomically
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _utc_seconds(sec: int) -> str:
+    """UTC ISO-8601 date/time (no fraction, no zone) for a unix second, formatted once per second."""
+    global _TS_CACHE
+    cached_sec, text = _TS_CACHE
+    if cached_sec != sec:
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, text)
+    return text
+
 
 class _UTCFORMATTER(logging.Formatter):
     converter = staticmethod(time.gmtime)
+    # positional equivalent of _TEXT_FMT, so records skip PercentStyle's per-field dict lookups
+    _TEXT_TMPL = "%s %-7s %-4s %-15.15s:%4d: %s"
 
-
-class _ProgramFilter(logging.Filter):
-    """Injects program identifier and computed 'source' into each record."""
-    def __init__(self, prog: str = "kess"):
-        super().__init__()
+    def __init__(self, *args: Any, prog: str = "kess", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
         self._prog = prog
+        self._fixed_fmt = self._fmt == _TEXT_FMT
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        # Ensure these fields always exist
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        # prog comes from the record when a caller bound one (extra/with_context)
+        if self._fixed_fmt:
+            return self._TEXT_TMPL % (
+                record.asctime, record.levelname, getattr(record, "prog", self._prog),
+                record.module, record.lineno, record.message,
+            )
         if not hasattr(record, "prog"):
             record.prog = self._prog
-        if not hasattr(record, "source"):
-            record.source = f"{record.module}:{record.lineno}"
-        return True
+        return super().formatMessage(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:  # noqa: N802
+        if datefmt == _TIMEFMT:
+            return _utc_seconds(int(record.created)) + "Z"
+        return super().formatTime(record, datefmt)
 
 
 class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record. The fixed leading fields are emitted from
+    pre-serialized key pieces; only per-record values and extras are encoded.
+    """
+    _FIXED_KEYS = frozenset({"timestamp", "level", "prog", "source", "logger", "msg"})
+    _MEMO_MAX = 1024
+
+    def __init__(self, *args: Any, prog: str = "kess", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prog = prog
+        self._dumps, self._dumps_str = _json_encoders()
+        # encoded JSON literals for low-cardinality values (levels, loggers, sources)
+        self._memo: Dict[str, str] = {}
+
+    def _enc(self, value: Any) -> str:
+        if type(value) is not str:
+            # record-supplied (e.g. extra={"prog": ...}); may be unhashable or non-text
+            return self._dumps(value)
+        out = self._memo.get(value)
+        if out is None:
+            out = self._dumps_str(value)
+            if len(self._memo) < self._MEMO_MAX:
+                self._memo[value] = out
+        return out
+
     def format(self, record: logging.LogRecord) -> str:
-        ts = datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat().replace("+00:00", "Z")
-
-        payload: Dict[str, Any] = {
-            "timestamp": ts,
-            "level": record.levelname,
-            "prog": getattr(record, "prog", "kess"),
-            "source": f"{record.module}:{record.lineno}",
-            "logger": record.name,
-            "msg": record.getMessage(),
-        }
+        ts = f"{_utc_seconds(int(record.created))}.{int(record.msecs):03d}Z"
+        prog = getattr(record, "prog", self._prog)
+        source = f"{record.module}:{record.lineno}"
+        msg = record.getMessage()
 
         # include any extra fields
-        for k, v in record.__dict__.items():
-            if k in _STD_FIELDS or k.startswith("_") or k in ("prog", "source"):
-                continue
-            payload[k] = v
+        extras: Dict[str, Any] = {
+            k: v for k, v in record.__dict__.items() if k not in _SKIP and k[:1] != "_"
+        }
         if record.exc_info:
-            payload["exc"] = self.formatException(record.exc_info)
+            extras["exc"] = self.formatException(record.exc_info)
+
+        if extras and not self._FIXED_KEYS.isdisjoint(extras):
+            # an extra shadows a fixed field; let the encoder resolve it as a plain dict
+            payload: Dict[str, Any] = {
+                "timestamp": ts, "level": record.levelname, "prog": prog,
+                "source": source, "logger": record.name, "msg": msg,
+            }
+            payload.update(extras)
+            return self._dumps(payload)
 
-        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        memo, enc = self._memo, self._enc
+        head = (
+            '{"timestamp":"' + ts
+            + '","level":' + (memo.get(record.levelname) or enc(record.levelname))
+            + ',"prog":' + enc(prog)
+            + ',"source":' + (memo.get(source) or enc(source))
+            + ',"logger":' + (memo.get(record.name) or enc(record.name))
+            + ',"msg":' + self._dumps_str(msg)
+        )
+        if extras:
+            return head + "," + self._dumps(extras)[1:]
+        return head + "}"
+
+
+class _BinaryStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that UTF-8 encodes each formatted line once and writes it straight
+    to the stream's file descriptor, bypassing the text and buffer layers (one syscall
+    per record; the handler lock keeps lines whole). The stream is flushed before each
+    write so lines stay ordered with print() and other writers sharing it. Falls back to
+    plain StreamHandler behaviour for streams without a real fd (e.g. io.StringIO).
+    """
+    def __init__(self, stream: Any = None) -> None:
+        super().__init__(stream)
+        self._fd = self._fileno(self.stream)
+
+    @staticmethod
+    def _fileno(stream: Any) -> Optional[int]:
+        try:
+            return stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def setStream(self, stream: Any) -> Any:  # noqa: N802
+        # retarget the raw writes along with the stream
+        self.acquire()
+        try:
+            old = super().setStream(stream)
+            self._fd = self._fileno(self.stream)
+        finally:
+            self.release()
+        return old
+
+    def emit(self, record: logging.LogRecord) -> None:
+        fd = self._fd
+        if fd is None:
+            super().emit(record)
+            return
+        try:
+            data = memoryview((self.format(record) + "\n").encode("utf-8"))
+            # anything buffered by other writers of this stream must land first
+            self.stream.flush()
+            while data:
+                data = data[os.write(fd, data):]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def _default_format() -> str:
@@ -75,56 +224,110 @@ def init_logging(*, level: str | None = None, fmt: str | None = None, prog: str
     global _CONFIGURED
     if _CONFIGURED:
         return
+    with _INIT_LOCK:
+        # re-check: another thread may have configured logging while we waited
+        if _CONFIGURED:
+            return
 
-    level_str = (level or os.getenv("KESS_LOG_LEVEL", "INFO")).upper()
-    fmt_str = (fmt or os.getenv("KESS_LOG_FORMAT", _default_format())).lower()
+        level_str = (level or os.getenv("KESS_LOG_LEVEL", "INFO")).upper()
+        # only probe the environment for a default when nothing was configured
+        fmt_str = (fmt or os.getenv("KESS_LOG_FORMAT") or _default_format()).lower()
 
-    lvl = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARN": logging.WARNING,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }.get(level_str, logging.INFO)
+        lvl = _LEVEL_MAP.get(level_str, logging.INFO)
 
-    root = logging.getLogger()
-    root.setLevel(lvl)
+        root = logging.getLogger()
+        root.setLevel(lvl)
 
-    for h in list(root.handlers):
-        root.removeHandler(h)
+        for h in list(root.handlers):
+            root.removeHandler(h)
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.addFilter(_ProgramFilter(prog=prog))
+        if fmt_str == "json":
+            handler: logging.Handler = _BinaryStreamHandler(sys.stdout)
+            handler.setFormatter(JsonFormatter(prog=prog))
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(_UTCFORMATTER(fmt=_TEXT_FMT, datefmt=_TIMEFMT, prog=prog))
 
-    if fmt_str == "json":
-        handler.setFormatter(JsonFormatter())
-    else:
-        handler.setFormatter(_UTCFORMATTER(fmt=_TEXT_FMT, datefmt=_TIMEFMT))
+        root.addHandler(handler)
 
-    root.addHandler(handler)
+        # Adjust levels for noisy libraries
+        logging.getLogger("boto3").setLevel(logging.WARNING)
+        logging.getLogger("botocore").setLevel(logging.WARNING)
+        logging.getLogger("urllib3").setLevel(logging.WARNING)
+        logging.getLogger("kubernetes").setLevel(logging.INFO)
 
-    # Adjust levels for noisy libraries
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("kubernetes").setLevel(logging.INFO)
-
-    _CONFIGURED = True
+        _CONFIGURED = True
 
 
 def get_logger(name: str = "kess") -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Frames to add to stacklevel so records point at our caller, not the adapter method.
+# 3.11+ counts stacklevel over non-logging frames; 3.10 applies it from Logger._log's
+# caller, which already is the adapter method's caller.
+_STACK_BUMP = 1 if sys.version_info >= (3, 11) else 0
+
+
 class _CtxAdapter(logging.LoggerAdapter):
+    """
+    LoggerAdapter bound to static context fields. The level methods check the level
+    and call Logger._log directly, skipping the adapter's log()/process() hops; the
+    rest of the LoggerAdapter API is inherited unchanged.
+    """
+
+    def __init__(self, logger: logging.Logger, extra: Dict[str, Any]) -> None:
+        super().__init__(logger, extra)
+        self._emit = logger._log
+
     def process(self, msg, kwargs):
-        ctx = dict(self.extra)
-        extra = kwargs.get("extra") or {}
-        ctx.update(extra)
-        kwargs["extra"] = ctx
+        # Bound context is only read by makeRecord, so share it unless the call adds fields
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
         return msg, kwargs
 
+    def _kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        _, kwargs = self.process(None, kwargs)
+        if _STACK_BUMP:
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + _STACK_BUMP
+        return kwargs
+
+    def debug(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, msg, args, **self._kwargs(kwargs))
+
+    def info(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, msg, args, **self._kwargs(kwargs))
+
+    def warning(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, msg, args, **self._kwargs(kwargs))
+
+    def warn(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        warnings.warn("The 'warn' method is deprecated, use 'warning' instead", DeprecationWarning, 2)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, msg, args, **self._kwargs(kwargs))
+
+    def error(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._emit(logging.ERROR, msg, args, **self._kwargs(kwargs))
+
+    def exception(self, msg: object, *args: Any, exc_info: Any = True, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._emit(logging.ERROR, msg, args, exc_info=exc_info, **self._kwargs(kwargs))
+
+    def critical(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._emit(logging.CRITICAL, msg, args, **self._kwargs(kwargs))
+
+    fatal = critical
+
+    def log(self, level: int, msg: object, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(level):
+            self._emit(level, msg, args, **self._kwargs(kwargs))
+
+
 def with_context(logger: logging.Logger, **ctx: Any) -> logging.LoggerAdapter:
     """Bind static context fields: log = with_context(get_logger(__name__), registry=r, ns=ns)"""
     return _CtxAdapter(logger, ctx)
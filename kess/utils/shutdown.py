@@ -6,9 +6,11 @@ Handles signal processing, shutdown coordination, and cleanup orchestration.
 import signal
 import threading
 import time
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 from kess.utils.log_setup import get_logger, with_context
 
+_SIGNAL_NAMES = {int(s): s.name for s in signal.Signals}
+
 
 class ShutdownManager:
     """
@@ -33,7 +35,7 @@ class ShutdownManager:
         self._shutdown_start_time: Optional[float] = None
 
         # Components to shut down
-        self._shutdown_hooks: List[Callable[[], None]] = []
+        self._shutdown_hooks: List[Tuple[str, Callable[[], None]]] = []
         self._shutdown_lock = threading.Lock()
 
         # Signal handling
@@ -53,7 +55,7 @@ class ShutdownManager:
 
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle shutdown signals."""
-        signal_name = signal.Signals(signum).name if hasattr(signal, 'Signals') else f"SIG{signum}"
+        signal_name = _SIGNAL_NAMES.get(signum) or f"SIG{signum}"
         self._log_ctx.info("Received %s signal, initiating shutdown", signal_name)
         self.request_shutdown()
 
@@ -64,9 +66,10 @@ class ShutdownManager:
         Args:
             hook: Function to call during shutdown (should be fast and non-blocking)
         """
+        name = getattr(hook, "__name__", None) or repr(hook)
         with self._shutdown_lock:
-            self._shutdown_hooks.append(hook)
-        self._log_ctx.debug("Registered shutdown hook: %s", hook.__name__ if hasattr(hook, '__name__') else str(hook))
+            self._shutdown_hooks.append((name, hook))
+        self._log_ctx.debug("Registered shutdown hook: %s", name)
 
     def request_shutdown(self) -> None:
         """Request application shutdown."""
@@ -75,7 +78,7 @@ class ShutdownManager:
             return
 
         self._shutdown_requested.set()
-        self._shutdown_start_time = time.time()
+        self._shutdown_start_time = time.monotonic()
         self._log_ctx.info("Shutdown requested")
 
     def is_shutdown_requested(self) -> bool:
@@ -105,10 +108,10 @@ class ShutdownManager:
 
     def get_remaining_grace_time(self) -> float:
         """Get remaining grace period time in seconds."""
-        if not self._shutdown_start_time:
+        if self._shutdown_start_time is None:
             return self.grace_period_seconds
 
-        elapsed = time.time() - self._shutdown_start_time
+        elapsed = time.monotonic() - self._shutdown_start_time
         remaining = max(0, self.grace_period_seconds - elapsed)
         return remaining
 
@@ -130,14 +133,12 @@ class ShutdownManager:
 
         if hooks:
             self._log_ctx.info("Executing %d shutdown hooks", len(hooks))
-            for hook in hooks:
+            for name, hook in hooks:
                 try:
-                    hook_name = hook.__name__ if hasattr(hook, '__name__') else str(hook)
-                    self._log_ctx.debug("Executing shutdown hook: %s", hook_name)
+                    self._log_ctx.debug("Executing shutdown hook: %s", name)
                     hook()
                 except Exception as e:
-                    self._log_ctx.error("Error in shutdown hook %s: %s",
-                                      hook.__name__ if hasattr(hook, '__name__') else str(hook), e)
+                    self._log_ctx.error("Error in shutdown hook %s: %s", name, e)
         else:
             self._log_ctx.debug("No shutdown hooks registered")
 
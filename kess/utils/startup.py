@@ -1,20 +1,42 @@
 import argparse
-from importlib.metadata import PackageNotFoundError, version as pkg_version
+import functools
+import sys
 from kess.utils.log_setup import get_logger, with_context
 from pathlib import Path
+from typing import Optional
 
 _log = get_logger(__name__)
+_PARSER: Optional[argparse.ArgumentParser] = None
 
+@functools.cache
 def resolve_version() -> str:
     """Resolve application version"""
+    from importlib.metadata import PackageNotFoundError, version as pkg_version
     try:
         return pkg_version("kess")
     except PackageNotFoundError:
         from kess import __version__ as ver
         return ver
 
+class _VersionAction(argparse.Action):
+    """Like action='version', but only resolves the version when the flag is used."""
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # stdout, like the stock version action (parser.exit(message=...) goes to stderr)
+        parser._print_message(f"{parser.prog} {resolve_version()}\n", sys.stdout)
+        parser.exit()
+
 def create_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser"""
+    """Create command line argument parser (built once, then reused)"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="kess",
         description="KESS — Kubernetes ECR Secret Sync",
@@ -93,33 +115,31 @@ Examples:
 
     parser.add_argument(
         '--version', '-v',
-        action='version',
-        version=f'%(prog)s {resolve_version()}'
+        action=_VersionAction
     )
 
     return parser
 
 
+# (attribute, predicate, error message); None means "not given, use config/default"
+_VALIDATORS = (
+    ("loop_interval", lambda v: v is None or v > 0, "Loop interval must be positive"),
+    ("token_refresh_threshold", lambda v: v is None or v > 0, "Token refresh threshold must be positive"),
+    ("health_port", lambda v: v is None or 1 <= v <= 65535, "Health port must be between 1 and 65535"),
+)
+
 def validate_arguments(args: argparse.Namespace) -> bool:
     """Validate command line arguments"""
     log_ctx = with_context(_log, source="validate_arguments")
 
     if args.config_file and args.config_file != '/etc/kess/config.yaml':
-        config_path = Path(args.config_file)
-        if not config_path.exists():
-            log_ctx.error(f"Configuration file not found: {args.config}")
+        if not Path(args.config_file).exists():
+            log_ctx.error("Configuration file not found: %s", args.config_file)
             return False
 
-    if args.loop_interval and args.loop_interval != 5 and args.loop_interval <= 0:
-        log_ctx.error("Loop interval must be positive")
-        return False
-
-    if args.token_refresh_threshold and args.token_refresh_threshold != 11 and args.token_refresh_threshold <= 0:
-        log_ctx.error("Token refresh threshold must be positive")
-        return False
-
-    if args.health_port and args.health_port != 8080 and (args.health_port < 1 or args.health_port > 65535):
-        log_ctx.error("Health port must be between 1 and 65535")
-        return False
+    for attr, is_valid, message in _VALIDATORS:
+        if not is_valid(getattr(args, attr, None)):
+            log_ctx.error(message)
+            return False
 
     return True
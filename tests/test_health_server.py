@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from kess.health.server import HealthServer
+
+
+class _Check:
+    """Readiness check that counts its runs."""
+
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.ok, None if self.ok else "down"
+
+
+class HealthServerCacheTest(unittest.TestCase):
+    def _server(self, ttl=60.0, ok=True):
+        server = HealthServer(status_cache_seconds=ttl)
+        check = _Check(ok)
+        server.register_readiness_check("c", check, fast=True)
+        server.set_ready(True)
+        return server, check
+
+    def test_checks_run_just_after_boot(self):
+        # monotonic() counts from boot and can be below the TTL on a fresh host
+        server, check = self._server(ttl=0.5, ok=False)
+        with mock.patch("kess.health.server.time.monotonic", return_value=0.1):
+            self.assertEqual(server._handle_readyz()[0], 503)
+            self.assertEqual(server._status_payload()["checks"]["c"]["ok"], False)
+        self.assertEqual(check.calls, 1)
+
+    def test_results_reused_within_ttl(self):
+        server, check = self._server()
+        for _ in range(3):
+            self.assertEqual(server._handle_readyz()[0], 200)
+            server._status_payload()
+        self.assertEqual(check.calls, 1)
+
+    def test_results_expire_after_ttl(self):
+        server, check = self._server(ttl=0.5)
+        with mock.patch("kess.health.server.time.monotonic", return_value=1000.0) as now:
+            server._handle_readyz()
+            now.return_value = 1000.4
+            server._handle_readyz()
+            self.assertEqual(check.calls, 1)
+            now.return_value = 1000.6
+            server._handle_readyz()
+        self.assertEqual(check.calls, 2)
+
+    def test_zero_ttl_disables_caching(self):
+        server, check = self._server(ttl=0)
+        server._handle_readyz()
+        server._handle_readyz()
+        self.assertEqual(check.calls, 2)
+
+    def test_setters_invalidate(self):
+        server, check = self._server()
+        setters = (
+            lambda: server.set_ready(True),
+            lambda: server.set_liveness_ok(True),
+            lambda: server.set_last_sync(123),
+            lambda: server.set_next_sync_in(30),
+            lambda: server.register_readiness_check("other", lambda: (True, None), fast=True),
+            lambda: server.set_shutting_down(False),
+        )
+        server._status_payload()
+        for n, setter in enumerate(setters, start=2):
+            setter()
+            server._status_payload()
+            self.assertEqual(check.calls, n)
+        payload = server._status_payload()
+        self.assertEqual((payload["last_sync"], payload["next_sync_in"]), (123, 30))
+        self.assertEqual(list(payload["checks"]), ["c", "other"])
+
+    def test_full_bypasses_both_caches(self):
+        server, check = self._server()
+        server._status_payload()
+        server._status_payload(full=True)
+        server._status_payload(full=True)
+        server._status_payload()
+        self.assertEqual(check.calls, 3)
+
+    def test_build_racing_invalidation_is_not_stored(self):
+        server = HealthServer(status_cache_seconds=60)
+        gate = threading.Event()
+        started = threading.Event()
+
+        def slow_check():
+            started.set()
+            gate.wait(5)
+            return True, None
+
+        server.register_readiness_check("slow", slow_check, fast=True)
+        server.set_ready(True)
+        builder = threading.Thread(target=server._status_payload)
+        builder.start()
+        self.assertTrue(started.wait(5))
+        server.set_last_sync(123)  # invalidates while the build above is in flight
+        gate.set()
+        builder.join(5)
+        self.assertEqual(server._status_payload()["last_sync"], 123)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import io
+import json
+import logging
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from kess.utils import log_setup
+from kess.utils.log_setup import JsonFormatter, with_context
+
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    orjson = None
+
+TS = "2024-01-01T00:00:00.123Z"
+
+
+def _record(msg="hello %s", args=("world",), levelno=logging.INFO, exc_info=None, **extra):
+    record = logging.LogRecord("kess.sync", levelno, "/app/kess/sync.py", 42, msg, args, exc_info)
+    record.created, record.msecs = 1704067200.123, 123.0
+    for k, v in extra.items():
+        setattr(record, k, v)
+    return record
+
+
+class _JsonFormatterCases:
+    """Pinned output for JsonFormatter; run once per encoder backend."""
+
+    def formatter(self) -> JsonFormatter:
+        raise NotImplementedError
+
+    def test_plain(self):
+        self.assertEqual(
+            self.formatter().format(_record()),
+            '{"timestamp":"' + TS + '","level":"INFO","prog":"kess","source":"sync:42",'
+            '"logger":"kess.sync","msg":"hello world"}',
+        )
+
+    def test_extras(self):
+        out = self.formatter().format(_record(registry="r.example", attempt=3, tags=["a", "b"]))
+        self.assertEqual(
+            out,
+            '{"timestamp":"' + TS + '","level":"INFO","prog":"kess","source":"sync:42",'
+            '"logger":"kess.sync","msg":"hello world","registry":"r.example","attempt":3,"tags":["a","b"]}',
+        )
+
+    def test_shadowed_key(self):
+        out = self.formatter().format(_record(level="custom", msg_id=1))
+        self.assertEqual(
+            out,
+            '{"timestamp":"' + TS + '","level":"custom","prog":"kess","source":"sync:42",'
+            '"logger":"kess.sync","msg":"hello world","msg_id":1}',
+        )
+
+    def test_exc_info(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record(levelno=logging.ERROR, exc_info=sys.exc_info())
+        formatter = self.formatter()
+        out = formatter.format(record)
+        self.assertEqual(
+            json.loads(out),
+            {
+                "timestamp": TS, "level": "ERROR", "prog": "kess", "source": "sync:42",
+                "logger": "kess.sync", "msg": "hello world",
+                "exc": formatter.formatException(record.exc_info),
+            },
+        )
+        self.assertIn("ValueError: boom", out)
+
+    def test_prog_override(self):
+        out = self.formatter().format(_record(prog="other"))
+        self.assertIn('"prog":"other",', out)
+
+    def test_odd_prog(self):
+        formatter = self.formatter()
+        for prog, encoded in (
+            (["a", "b"], '["a","b"]'),
+            ({"k": 1}, '{"k":1}'),
+            (7, "7"),
+            (None, "null"),
+        ):
+            with self.subTest(prog=prog):
+                out = formatter.format(_record(prog=prog))
+                self.assertIn(',"prog":' + encoded + ',"source":', out)
+                self.assertEqual(json.loads(out)["prog"], prog)
+
+    def test_odd_prog_through_logger(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(self.formatter())
+        logger = logging.getLogger("kess.test.odd_prog")
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        with mock.patch.object(handler, "handleError") as handle_error:
+            logger.warning("x", extra={"prog": ["a", "b"]})
+            with_context(logger, prog={"k": 1}).warning("y")
+        handle_error.assert_not_called()
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([(r["msg"], r["prog"]) for r in lines], [("x", ["a", "b"]), ("y", {"k": 1})])
+
+
+@unittest.skipIf(orjson is None, "orjson not installed")
+class JsonFormatterOrjsonTest(_JsonFormatterCases, unittest.TestCase):
+    def formatter(self) -> JsonFormatter:
+        formatter = JsonFormatter()
+        self.assertIsNot(formatter._dumps, log_setup._dumps_stdlib)
+        return formatter
+
+
+class JsonFormatterStdlibTest(_JsonFormatterCases, unittest.TestCase):
+    def formatter(self) -> JsonFormatter:
+        with mock.patch.object(log_setup, "_json_encoders", return_value=log_setup._STDLIB_ENCODERS):
+            return JsonFormatter()
+
+
+class BinaryStreamHandlerTest(unittest.TestCase):
+    def _handler(self, stream):
+        handler = log_setup._BinaryStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def test_writes_to_fd_in_order_with_stream(self):
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as f:
+            handler = self._handler(f)
+            f.write("buffered\n")
+            handler.emit(_record("one", ()))
+            handler.emit(_record("two", ()))
+            f.seek(0)
+            self.assertEqual(f.read(), "buffered\none\ntwo\n")
+
+    def test_set_stream_retargets_writes(self):
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as f:
+            handler = self._handler(f)
+            other = io.StringIO()
+            self.assertIs(handler.setStream(other), f)
+            handler.emit(_record("to stringio", ()))
+            self.assertEqual(other.getvalue(), "to stringio\n")
+
+            handler.setStream(f)
+            handler.emit(_record("to file", ()))
+            f.seek(0)
+            self.assertEqual(f.read(), "to file\n")
+            self.assertEqual(other.getvalue(), "to stringio\n")
+
+
+if __name__ == "__main__":
+    unittest.main()